@@ -0,0 +1,173 @@
+"""
+Convergence statistics for the early-stop sweep of WanVideoAllParametersLoop.
+
+Scores are modelled as an intercept plus one additive effect per axis value.
+The model is kept as running sums of its normal equations, so recording a
+score is O(axes^2) and solving does not depend on how many scores were seen.
+"""
+
+from __future__ import annotations
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class RunningStats:
+    """
+    Incremental mean/variance accumulator (Welford's algorithm)
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+class AdditiveEffects:
+    """
+    Additive main-effects model of the score, updated with every recorded score
+    and re-solved lazily when a test needs it
+    """
+
+    # Relative pivot size below which the design is treated as confounded
+    PIVOT_TOLERANCE = 1e-9
+
+    def __init__(self, axes: Dict[str, Sequence]):
+        self.axes = {name: list(values) for name, values in axes.items()}
+        self.levels = [(name, value) for name, values in self.axes.items() for value in values]
+        self._level_index = {level: i for i, level in enumerate(self.levels)}
+
+        self.count = 0
+        self._total = 0.0
+        self._total_sq = 0.0
+        self._level_stats = [RunningStats() for _ in self.levels]
+        # Number of scores in which two levels (of different axes) appeared together
+        self._co_counts = [[0] * len(self.levels) for _ in self.levels]
+        self._fit = None
+
+    def add(self, combination: Sequence, score: float) -> None:
+        """Record the score of a combination given in axis order."""
+        indices = [self._level_index[(name, value)] for name, value in zip(self.axes, combination)]
+
+        self.count += 1
+        self._total += score
+        self._total_sq += score * score
+        for i in indices:
+            self._level_stats[i].add(score)
+            for j in indices:
+                self._co_counts[i][j] += 1
+
+        self._fit = None
+
+    def level_count(self, name: str, value) -> int:
+        return self._level_stats[self._level_index[(name, value)]].count
+
+    def fit(self) -> Optional[dict]:
+        """Least-squares effects and residual variance, or None while the model is not identifiable."""
+        if self._fit is None:
+            self._fit = self._solve()
+        return self._fit or None
+
+    def _solve(self):
+        # The first observed value of every axis is the reference (effect 0)
+        references = {}
+        parameters = []
+        for name, values in self.axes.items():
+            for value in values:
+                i = self._level_index[(name, value)]
+                if self._level_stats[i].count == 0:
+                    continue
+                if name in references:
+                    parameters.append(i)
+                else:
+                    references[name] = i
+
+        dof = self.count - (1 + len(parameters))
+        if dof <= 0:
+            return {}
+
+        # Normal equations for [intercept, parameters...]
+        size = 1 + len(parameters)
+        matrix = [[0.0] * size for _ in range(size)]
+        rhs = [0.0] * size
+        matrix[0][0] = float(self.count)
+        rhs[0] = self._total
+        for row, i in enumerate(parameters, start=1):
+            stats = self._level_stats[i]
+            matrix[0][row] = matrix[row][0] = float(stats.count)
+            rhs[row] = stats.mean * stats.count
+            for column, j in enumerate(parameters, start=1):
+                matrix[row][column] = float(self._co_counts[i][j])
+
+        solution = _solve_linear(matrix, list(rhs), self.PIVOT_TOLERANCE)
+        if solution is None:
+            return {}
+
+        residual_ss = self._total_sq - sum(b * r for b, r in zip(solution, rhs))
+        effects = {name: {} for name in self.axes}
+        for name, i in references.items():
+            effects[name][self.levels[i][1]] = 0.0
+        for b, i in zip(solution[1:], parameters):
+            name, value = self.levels[i]
+            effects[name][value] = b
+
+        return {"effects": effects, "residual_variance": max(residual_ss, 0.0) / dof, "dof": dof}
+
+    def axis_effect(self, name: str, min_samples: int) -> Optional[Tuple[float, float]]:
+        """
+        Spread of the fitted effects of an axis and a two standard error margin
+        from the residual variance of the full model. Returns None until every
+        value has at least min_samples scores and the model has residual dof.
+        """
+        counts = [self.level_count(name, value) for value in self.axes[name]]
+        if min(counts) < min_samples:
+            return None
+
+        fit = self.fit()
+        if fit is None:
+            return None
+
+        effects = list(fit["effects"][name].values())
+        effect = max(effects) - min(effects)
+        margin = 2.0 * math.sqrt(fit["residual_variance"] / min(counts))
+        return effect, margin
+
+    def best_value(self, name: str, higher_is_better: bool = True):
+        """Axis value with the best fitted effect."""
+        effects = self.fit()["effects"][name]
+        pick = max if higher_is_better else min
+        return pick(effects, key=effects.get)
+
+
+def _solve_linear(matrix: List[List[float]], rhs: List[float], tolerance: float) -> Optional[List[float]]:
+    """Gaussian elimination with partial pivoting; None when the system is singular."""
+    size = len(rhs)
+    scale = max(abs(matrix[i][i]) for i in range(size)) or 1.0
+
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda row: abs(matrix[row][column]))
+        if abs(matrix[pivot][column]) <= tolerance * scale:
+            return None
+        matrix[column], matrix[pivot] = matrix[pivot], matrix[column]
+        rhs[column], rhs[pivot] = rhs[pivot], rhs[column]
+
+        for row in range(column + 1, size):
+            factor = matrix[row][column] / matrix[column][column]
+            if factor:
+                for k in range(column, size):
+                    matrix[row][k] -= factor * matrix[column][k]
+                rhs[row] -= factor * rhs[column]
+
+    solution = [0.0] * size
+    for row in range(size - 1, -1, -1):
+        solution[row] = (rhs[row] - sum(matrix[row][k] * solution[k] for k in range(row + 1, size))) / matrix[row][row]
+    return solution
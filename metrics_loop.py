@@ -3,10 +3,13 @@ ComfyUI-WanVideo-Scheduler-Loop
 A custom node for looping through WanVideo schedulers in ComfyUI
 """
 
+import itertools
 import random
 import sys
 import os
 from .scheduler_list_getter import get_wanvideo_scheduler_list
+from . import prefetch_registry
+from .convergence import AdditiveEffects, RunningStats
 
 # WanVideo scheduler list from ComfyUI-WanVideoWrapper
 # This is the exact list from wanvideo/schedulers/__init__.py
@@ -72,8 +75,9 @@ class WanVideoSchedulerLoop:
     _global_counters = {"sequential": 0, "ping_pong": 0, "random": 0}
     _last_execution_ids = {"sequential": None, "ping_pong": None, "random": None}
     
-    RETURN_TYPES = (WANVIDEO_SCHEDULERS, "STRING", "INT", "INT", "STRING")
-    RETURN_NAMES = ("scheduler", "scheduler_name", "current_index", "total_combinations", "current_combination")
+    RETURN_TYPES = (WANVIDEO_SCHEDULERS, "STRING", "INT", "INT", "STRING", WANVIDEO_SCHEDULERS, "STRING")
+    RETURN_NAMES = ("scheduler", "scheduler_name", "current_index", "total_combinations", "current_combination",
+                    "next_scheduler", "upcoming_combinations")
     FUNCTION = "loop_scheduler"
     CATEGORY = "WanVideo/Schedulers"
 
@@ -90,10 +94,51 @@ class WanVideoSchedulerLoop:
                 "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
                 "reset": ("BOOLEAN", {"default": False}),
             },
-            "optional": skip_inputs
+            "optional": {
+                "prefetch_count": ("INT", {"default": 1, "min": 0, "max": 16}),
+                **skip_inputs
+            }
         }
 
-    def loop_scheduler(self, mode, seed, reset=False, **kwargs):
+    @staticmethod
+    def _select(mode, step, seed, available_schedulers):
+        """
+        Pick the scheduler for a given step without touching the loop state
+        """
+        if mode == "sequential":
+            # Sequential loop through schedulers (cycles back to first when complete)
+            index = step % len(available_schedulers)
+            selected_scheduler = available_schedulers[index]
+            
+        elif mode == "random":
+            # Random selection with seed
+            rng = random.Random(seed + step)  # Different random for each step
+            selected_scheduler = rng.choice(available_schedulers)
+            index = available_schedulers.index(selected_scheduler)
+            
+        elif mode == "ping_pong":
+            # Ping pong pattern: forward then backward
+            cycle_length = len(available_schedulers) * 2 - 2
+            if cycle_length <= 0:
+                cycle_length = 1
+            
+            pos = step % cycle_length
+            if pos < len(available_schedulers):
+                index = pos
+            else:
+                index = len(available_schedulers) - 2 - (pos - len(available_schedulers))
+            
+            index = max(0, min(index, len(available_schedulers) - 1))
+            selected_scheduler = available_schedulers[index]
+        
+        else:
+            # Fallback
+            index = 0
+            selected_scheduler = available_schedulers[0]
+        
+        return index, selected_scheduler
+
+    def loop_scheduler(self, mode, seed, reset=False, prefetch_count=1, **kwargs):
         """
         Advanced scheduler looping with automatic state management
         """
@@ -132,43 +177,24 @@ class WanVideoSchedulerLoop:
                 setattr(self, f'_first_call_done_{mode}', True)
         
         step = WanVideoSchedulerLoop._global_counters[mode]
-        
-        if mode == "sequential":
-            # Sequential loop through schedulers (cycles back to first when complete)
-            index = step % len(available_schedulers)
-            selected_scheduler = available_schedulers[index]
-            
-        elif mode == "random":
-            # Random selection with seed
-            random.seed(seed + step)  # Different random for each step
-            selected_scheduler = random.choice(available_schedulers)
-            index = available_schedulers.index(selected_scheduler)
-            
-        elif mode == "ping_pong":
-            # Ping pong pattern: forward then backward
-            cycle_length = len(available_schedulers) * 2 - 2
-            if cycle_length <= 0:
-                cycle_length = 1
-            
-            pos = step % cycle_length
-            if pos < len(available_schedulers):
-                index = pos
-            else:
-                index = len(available_schedulers) - 2 - (pos - len(available_schedulers))
-            
-            index = max(0, min(index, len(available_schedulers) - 1))
-            selected_scheduler = available_schedulers[index]
-        
-        else:
-            # Fallback
-            index = 0
-            selected_scheduler = available_schedulers[0]
+        index, selected_scheduler = self._select(mode, step, seed, available_schedulers)
 
         current_combination = f"Scheduler: {selected_scheduler}"
+        
+        # Look ahead without advancing the counter so downstream nodes can warm up
+        upcoming = []
+        for offset in range(1, max(prefetch_count, 1) + 1):
+            next_index, next_scheduler = self._select(mode, step + offset, seed, available_schedulers)
+            upcoming.append({"scheduler": next_scheduler, "index": next_index,
+                             "combination": f"Scheduler: {next_scheduler}"})
+        if prefetch_count > 0:
+            prefetch_registry.publish(prefetch_registry.source_key("WanVideoSchedulerLoop", mode), upcoming)
+        upcoming_combinations = "\n".join(entry["combination"] for entry in upcoming[:prefetch_count])
         # Log current selection for debugging
         print(f"WanVideo Scheduler Loop: Selected '{selected_scheduler}' (index: {index}, step: {step}, mode: {mode}) [Global: {WanVideoSchedulerLoop._global_counters[mode]}]")
         
-        return (selected_scheduler, selected_scheduler, index, total_combinations, current_combination)
+        return (selected_scheduler, selected_scheduler, index, total_combinations, current_combination,
+                upcoming[0]["scheduler"], upcoming_combinations)
 
 class WanVideoSchedulerInfo:
     """
@@ -215,8 +241,9 @@ class FloatRangeLoop:
     _global_counter = 0
     _last_execution_id = None
     
-    RETURN_TYPES = ("FLOAT", "FLOAT", "INT", "INT", "STRING")
-    RETURN_NAMES = ("cfg", "shift", "current_index", "total_combinations", "current_combination")
+    RETURN_TYPES = ("FLOAT", "FLOAT", "INT", "INT", "STRING", "FLOAT", "FLOAT", "STRING")
+    RETURN_NAMES = ("cfg", "shift", "current_index", "total_combinations", "current_combination",
+                    "next_cfg", "next_shift", "upcoming_combinations")
     FUNCTION = "loop_floats"
     CATEGORY = "WanVideo/FloatRange"
 
@@ -232,10 +259,28 @@ class FloatRangeLoop:
                 "shift_step": ("FLOAT", {"default": 0.5, "min": 0.1, "max": 10.0, "step": 0.1}),
                 "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
                 "reset": ("BOOLEAN", {"default": False}),
+            },
+            "optional": {
+                "prefetch_count": ("INT", {"default": 1, "min": 0, "max": 16}),
             }
         }
 
-    def loop_floats(self, cfg_start, cfg_end, cfg_step, shift_start, shift_end, shift_step, seed, reset=False):
+    @staticmethod
+    def _select(step, cfg_values, shift_values):
+        """
+        Pick the cfg and shift values for a given step without touching the loop state
+        """
+        # Sequential loop through combinations (cycles back to first when complete)
+        index = step % (len(cfg_values) * len(shift_values))
+        
+        # Calculate cfg and shift indices from combined index
+        cfg_index = index // len(shift_values)
+        shift_index = index % len(shift_values)
+        
+        return index, cfg_values[cfg_index], shift_values[shift_index]
+
+    def loop_floats(self, cfg_start, cfg_end, cfg_step, shift_start, shift_end, shift_step, seed, reset=False,
+                    prefetch_count=1):
         """
         Loop through combinations of cfg and shift values sequentially
         """
@@ -260,7 +305,9 @@ class FloatRangeLoop:
         total_combinations = len(cfg_values) * len(shift_values)
         
         if total_combinations == 0:
-            return (cfg_start, shift_start, 0, 0)
+            # Nothing to loop over: hold the start values and predict no change
+            current_combination = f"CFG {cfg_start:.2f}, Shift {shift_start:.2f}"
+            return (cfg_start, shift_start, 0, 0, current_combination, cfg_start, shift_start, "")
         
         # Reset counter if requested
         if reset:
@@ -280,26 +327,28 @@ class FloatRangeLoop:
                 setattr(self, '_first_call_done', True)
         
         step = FloatRangeLoop._global_counter
-        
-        # Sequential loop through combinations (cycles back to first when complete)
-        index = step % total_combinations
-        
-        # Calculate cfg and shift indices from combined index
-        cfg_index = index // len(shift_values)
-        shift_index = index % len(shift_values)
-        
-        selected_cfg = cfg_values[cfg_index]
-        selected_shift = shift_values[shift_index]
+        index, selected_cfg, selected_shift = self._select(step, cfg_values, shift_values)
 
         current_combination = f"CFG {selected_cfg:.2f}, Shift {selected_shift:.2f}"
         
+        # Look ahead without advancing the counter so downstream nodes can warm up
+        upcoming = []
+        for offset in range(1, max(prefetch_count, 1) + 1):
+            next_index, next_cfg, next_shift = self._select(step + offset, cfg_values, shift_values)
+            upcoming.append({"cfg": next_cfg, "shift": next_shift, "index": next_index,
+                             "combination": f"CFG {next_cfg:.2f}, Shift {next_shift:.2f}"})
+        if prefetch_count > 0:
+            prefetch_registry.publish(prefetch_registry.source_key("FloatRangeLoop"), upcoming)
+        upcoming_combinations = "\n".join(entry["combination"] for entry in upcoming[:prefetch_count])
+        
         # Log current selection for debugging
         print(f"FloatRange Loop: Selected cfg={selected_cfg}, shift={selected_shift} (index: {index}, step: {step}) [Global: {FloatRangeLoop._global_counter}]")
         print(f"  Available cfg values: {cfg_values}")
         print(f"  Available shift values: {shift_values}")
         print(f"  Total combinations: {total_combinations}")
         
-        return (selected_cfg, selected_shift, index, total_combinations, current_combination)
+        return (selected_cfg, selected_shift, index, total_combinations, current_combination,
+                upcoming[0]["cfg"], upcoming[0]["shift"], upcoming_combinations)
 
 class ParametersRangeLoop:
     """
@@ -310,8 +359,9 @@ class ParametersRangeLoop:
     _global_counter = 0
     _last_execution_id = None
     
-    RETURN_TYPES = ("INT", "FLOAT", "FLOAT", "INT", "INT", "STRING")
-    RETURN_NAMES = ("steps", "cfg", "shift" , "current_index", "total_combinations", "current_combination")
+    RETURN_TYPES = ("INT", "FLOAT", "FLOAT", "INT", "INT", "STRING", "INT", "FLOAT", "FLOAT", "STRING")
+    RETURN_NAMES = ("steps", "cfg", "shift" , "current_index", "total_combinations", "current_combination",
+                    "next_steps", "next_cfg", "next_shift", "upcoming_combinations")
     FUNCTION = "loop_parameters"
     CATEGORY = "WanVideo/ParametersRange"
 
@@ -331,11 +381,30 @@ class ParametersRangeLoop:
                 
                 "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
                 "reset": ("BOOLEAN", {"default": False}),
+            },
+            "optional": {
+                "prefetch_count": ("INT", {"default": 1, "min": 0, "max": 16}),
             }
         }
 
+    @staticmethod
+    def _select(step, cfg_values, shift_values, steps_values):
+        """
+        Pick the steps, cfg and shift values for a given step without touching the loop state
+        """
+        # Sequential loop through combinations (cycles back to first when complete)
+        index = step % (len(cfg_values) * len(shift_values) * len(steps_values))
+        
+        # Calculate cfg, shift, and steps indices from combined index
+        steps_index = index // (len(cfg_values) * len(shift_values))
+        remaining = index % (len(cfg_values) * len(shift_values))
+        cfg_index = remaining // len(shift_values)
+        shift_index = remaining % len(shift_values)
+        
+        return index, steps_values[steps_index], cfg_values[cfg_index], shift_values[shift_index]
+
     def loop_parameters(self, cfg_start, cfg_end, cfg_interval, shift_start, shift_end, shift_interval, 
-                       steps_start, steps_end, steps_interval, seed=0, reset=False):
+                       steps_start, steps_end, steps_interval, seed=0, reset=False, prefetch_count=1):
         """
         Loop through combinations of cfg, shift, and steps values sequentially
         """
@@ -392,7 +461,10 @@ class ParametersRangeLoop:
         total_combinations = len(cfg_values) * len(shift_values) * len(steps_values)
         
         if total_combinations == 0:
-            return (cfg_start, shift_start, steps_start, 0, 0, 0)
+            # Nothing to loop over: hold the start values and predict no change
+            current_combination = f"{steps_start} steps, CFG {cfg_start:.2f}, Shift {shift_start:.2f}"
+            return (steps_start, cfg_start, shift_start, 0, 0, current_combination,
+                    steps_start, cfg_start, shift_start, "")
         
         # Reset counter if requested
         if reset:
@@ -412,22 +484,20 @@ class ParametersRangeLoop:
                 setattr(self, '_first_call_done', True)
         
         step = ParametersRangeLoop._global_counter
-        
-        # Sequential loop through combinations (cycles back to first when complete)
-        index = step % total_combinations
-        
-        # Calculate cfg, shift, and steps indices from combined index
-        steps_index = index // (len(cfg_values) * len(shift_values))
-        remaining = index % (len(cfg_values) * len(shift_values))
-        cfg_index = remaining // len(shift_values)
-        shift_index = remaining % len(shift_values)
-        
-        selected_cfg = cfg_values[cfg_index]
-        selected_shift = shift_values[shift_index]
-        selected_steps = steps_values[steps_index]
+        index, selected_steps, selected_cfg, selected_shift = self._select(step, cfg_values, shift_values, steps_values)
 
         current_combination = f"{selected_steps} steps, CFG {selected_cfg:.2f}, Shift {selected_shift:.2f}"
         
+        # Look ahead without advancing the counter so downstream nodes can warm up
+        upcoming = []
+        for offset in range(1, max(prefetch_count, 1) + 1):
+            next_index, next_steps, next_cfg, next_shift = self._select(step + offset, cfg_values, shift_values, steps_values)
+            upcoming.append({"steps": next_steps, "cfg": next_cfg, "shift": next_shift, "index": next_index,
+                             "combination": f"{next_steps} steps, CFG {next_cfg:.2f}, Shift {next_shift:.2f}"})
+        if prefetch_count > 0:
+            prefetch_registry.publish(prefetch_registry.source_key("ParametersRangeLoop"), upcoming)
+        upcoming_combinations = "\n".join(entry["combination"] for entry in upcoming[:prefetch_count])
+        
         # Log current selection for debugging
         print(f"Parameters Range Loop: Selected steps={selected_steps}, cfg={selected_cfg}, shift={selected_shift} (index: {index}, step: {step}) [Global: {ParametersRangeLoop._global_counter}]")
         print(f"  Available cfg values: {cfg_values}")
@@ -435,7 +505,8 @@ class ParametersRangeLoop:
         print(f"  Available steps values: {steps_values}")
         print(f"  Total combinations: {total_combinations}")
         
-        return (selected_steps, selected_cfg, selected_shift, index, total_combinations, current_combination)
+        return (selected_steps, selected_cfg, selected_shift, index, total_combinations, current_combination,
+                upcoming[0]["steps"], upcoming[0]["cfg"], upcoming[0]["shift"], upcoming_combinations)
 
 class WanVideoAllParametersLoop:
     """
@@ -446,9 +517,16 @@ class WanVideoAllParametersLoop:
     # Global counters for different modes
     _global_counters = {"sequential": 0, "ping_pong": 0, "random": 0}
     _last_execution_ids = {"sequential": None, "ping_pong": None, "random": None}
+    # Early-stop convergence state for different modes
+    _convergence_states = {"sequential": None, "ping_pong": None, "random": None}
+    
+    # Axis order matches the combined index decomposition (scheduler varies fastest)
+    AXIS_NAMES = ("scheduler", "cfg", "shift", "steps")
     
-    RETURN_TYPES = ("INT", "FLOAT", "FLOAT", WANVIDEO_SCHEDULERS, "INT", "INT", "STRING")
-    RETURN_NAMES = ("steps", "cfg", "shift", "scheduler","current_index", "total_combinations", "current_combination")
+    RETURN_TYPES = ("INT", "FLOAT", "FLOAT", WANVIDEO_SCHEDULERS, "INT", "INT", "STRING", "STRING", "BOOLEAN",
+                    "INT", "FLOAT", "FLOAT", WANVIDEO_SCHEDULERS, "STRING")
+    RETURN_NAMES = ("steps", "cfg", "shift", "scheduler","current_index", "total_combinations", "current_combination", "collapse_report", "sweep_finished",
+                    "next_steps", "next_cfg", "next_shift", "next_scheduler", "upcoming_combinations")
     FUNCTION = "loop_all_parameters"
     CATEGORY = "WanVideo/AllParameters"
 
@@ -474,13 +552,194 @@ class WanVideoAllParametersLoop:
                 "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
                 "reset": ("BOOLEAN", {"default": False}),
             },
-            "optional": skip_inputs
+            "optional": {
+                "score": ("FLOAT", {"forceInput": True, "tooltip": "Quality score of the combination emitted on the previous run"}),
+                "early_stop": ("BOOLEAN", {"default": False, "tooltip": "Collapse axes whose effect on the score is below collapse_threshold"}),
+                "collapse_threshold": ("FLOAT", {"default": 0.01, "min": 0.0, "max": 100.0, "step": 0.001,
+                                                 "tooltip": "Score spread (plus a two standard error margin) below which an axis is considered flat"}),
+                "min_samples_per_value": ("INT", {"default": 2, "min": 2, "max": 100,
+                                                  "tooltip": "Scores required for every value of an axis before it can be collapsed"}),
+                "higher_is_better": ("BOOLEAN", {"default": True,
+                                                 "tooltip": "Collapse axes to the value with the highest score (disable for scores where lower is better)"}),
+                "prefetch_count": ("INT", {"default": 1, "min": 0, "max": 16}),
+                **skip_inputs
+            }
         }
         
         return base_inputs
 
+    @staticmethod
+    def _select(mode, step, seed, total_combinations, available_schedulers, cfg_values, shift_values, steps_values):
+        """
+        Pick the combination for a given step without touching the loop state
+        """
+        if mode == "sequential":
+            # Sequential loop through all combinations
+            index = step % total_combinations
+            
+        elif mode == "random":
+            # Random selection with seed
+            rng = random.Random(seed + step)  # Different random for each step
+            index = rng.randint(0, total_combinations - 1)
+            
+        elif mode == "ping_pong":
+            # Ping pong pattern: forward then backward
+            cycle_length = total_combinations * 2 - 2
+            if cycle_length <= 0:
+                cycle_length = 1
+            
+            pos = step % cycle_length
+            if pos < total_combinations:
+                index = pos
+            else:
+                index = total_combinations - 2 - (pos - total_combinations)
+            
+            index = max(0, min(index, total_combinations - 1))
+        
+        else:
+            # Fallback
+            index = 0
+        
+        # Calculate scheduler, cfg, shift, and steps indices from combined index
+        steps_index = index // (len(available_schedulers) * len(cfg_values) * len(shift_values))
+        remaining = index % (len(available_schedulers) * len(cfg_values) * len(shift_values))
+        
+        shift_index = remaining // (len(available_schedulers) * len(cfg_values))
+        remaining = remaining % (len(available_schedulers) * len(cfg_values))
+        
+        cfg_index = remaining // len(available_schedulers)
+        scheduler_index = remaining % len(available_schedulers)
+        
+        selected_scheduler = available_schedulers[scheduler_index]
+        selected_cfg = cfg_values[cfg_index]
+        selected_shift = shift_values[shift_index]
+        selected_steps = steps_values[steps_index]
+        
+        return index, selected_scheduler, selected_cfg, selected_shift, selected_steps
+
+    @classmethod
+    def _grid(cls, axes):
+        """
+        All combinations of the given axes in the usual index order (steps slowest, scheduler fastest)
+        """
+        return [
+            (scheduler, cfg, shift, steps)
+            for steps, shift, cfg, scheduler in itertools.product(*(axes[name] for name in reversed(cls.AXIS_NAMES)))
+        ]
+
+    def _update_convergence(self, mode, axes, score, reset, threshold, min_samples, higher_is_better):
+        """
+        Record the score of the previously emitted combination, collapse axes whose
+        effect is below the threshold and re-plan the remaining traversal
+        """
+        grid_key = tuple((name, tuple(values)) for name, values in axes.items())
+        state = WanVideoAllParametersLoop._convergence_states[mode]
+        
+        # Start fresh on reset or whenever the grid itself changed
+        if reset or state is None or state["grid_key"] != grid_key:
+            state = {
+                "grid_key": grid_key,
+                "grid": self._grid(axes),
+                "model": AdditiveEffects(axes),
+                "combination_stats": {},
+                "collapsed": {},
+                "visited": set(),
+                "last_combination": None,
+                "plan": None,
+            }
+            WanVideoAllParametersLoop._convergence_states[mode] = state
+        
+        # Only a new score can change the collapse decisions
+        if score is None or state["last_combination"] is None:
+            return state
+        
+        # The score fed into this execution belongs to the combination emitted last time
+        combination = state["last_combination"]
+        state["model"].add(combination, float(score))
+        state["combination_stats"].setdefault(combination, RunningStats()).add(float(score))
+        
+        newly_collapsed = False
+        for name in self.AXIS_NAMES:
+            if name in state["collapsed"] or len(axes[name]) < 2:
+                continue
+            
+            estimate = state["model"].axis_effect(name, min_samples)
+            if estimate is None:
+                continue
+            
+            effect, margin = estimate
+            if effect + margin < threshold:
+                best_value = state["model"].best_value(name, higher_is_better)
+                state["collapsed"][name] = (best_value, effect)
+                newly_collapsed = True
+                print(f"WanVideo All Parameters Loop: Collapsing {name} to {best_value} (effect {effect:.4f} + margin {margin:.4f} < {threshold})")
+        
+        if newly_collapsed:
+            reduced_axes = {
+                name: [state["collapsed"][name][0]] if name in state["collapsed"] else axes[name]
+                for name in self.AXIS_NAMES
+            }
+            state["grid"] = self._grid(reduced_axes)
+            # Only combinations that have not run yet are worth planning
+            state["plan"] = [combination for combination in state["grid"] if combination not in state["visited"]]
+        
+        return state
+
+    @staticmethod
+    def _plan_picks(mode, step, seed, remaining, count):
+        """
+        Pick the next combinations among those that have not run yet without touching the loop state
+        """
+        remaining = list(remaining)
+        picks = []
+        for offset in range(count):
+            if not remaining:
+                break
+            if mode == "random":
+                pick = random.Random(seed + step + offset).choice(remaining)
+            else:
+                # Forward order only; going back would revisit finished combinations
+                pick = remaining[0]
+            remaining.remove(pick)
+            picks.append(pick)
+        return picks
+
+    @staticmethod
+    def _best_combination(state, higher_is_better):
+        """
+        Best scored combination of the current grid, or its first combination when nothing is scored
+        """
+        scored = [combination for combination in state["grid"] if combination in state["combination_stats"]]
+        if not scored:
+            return state["grid"][0]
+        pick = max if higher_is_better else min
+        return pick(scored, key=lambda combination: state["combination_stats"][combination].mean)
+
+    @staticmethod
+    def _collapse_report(state, full_total, remaining, sweep_finished):
+        """
+        Describe collapse decisions and the resulting savings
+        """
+        if state is None:
+            return "Early stop disabled"
+        
+        run = len(state["visited"])
+        lines = [f"{name} collapsed to {value} (effect {effect:.4f})"
+                 for name, (value, effect) in state["collapsed"].items()]
+        if lines:
+            avoided = full_total - run - len(remaining)
+            lines.append(f"Avoided {avoided} of {full_total} combinations ({run} run, {len(remaining)} left to run)")
+        else:
+            lines.append(f"No axes collapsed ({state['model'].count} scores recorded, {run} of {full_total} combinations run)")
+        
+        if sweep_finished:
+            lines.append("Sweep finished: every remaining combination has run, holding the best scored combination")
+        return "\n".join(lines)
+
     def loop_all_parameters(self, mode, cfg_start, cfg_end, cfg_interval, shift_start, shift_end, shift_interval,
-                           steps_start, steps_end, steps_interval, seed=0, reset=False, **kwargs):
+                           steps_start, steps_end, steps_interval, seed=0, reset=False, score=None,
+                           early_stop=False, collapse_threshold=0.01, min_samples_per_value=2, higher_is_better=True,
+                           prefetch_count=1, **kwargs):
         """
         Advanced looping combining scheduler selection with parameter ranges
         """
@@ -549,9 +808,11 @@ class WanVideoAllParametersLoop:
         total_combinations = len(available_schedulers) * len(cfg_values) * len(shift_values) * len(steps_values)
         
         if total_combinations == 0:
-            return (available_schedulers[0] if available_schedulers else WANVIDEO_SCHEDULERS[0], 
-                    available_schedulers[0] if available_schedulers else WANVIDEO_SCHEDULERS[0], 
-                    cfg_start, shift_start, steps_start, 0, 0, 0)
+            # Nothing to loop over: hold the start values and predict no change
+            fallback_scheduler = available_schedulers[0] if available_schedulers else WANVIDEO_SCHEDULERS[0]
+            current_combination = f"Scheduler: {fallback_scheduler}, {steps_start} steps, CFG {cfg_start:.2f}, Shift {shift_start:.2f}"
+            return (steps_start, cfg_start, shift_start, fallback_scheduler, 0, 0, current_combination, "", False,
+                    steps_start, cfg_start, shift_start, fallback_scheduler, "")
         
         # Reset counter if requested
         if reset:
@@ -571,51 +832,62 @@ class WanVideoAllParametersLoop:
                 setattr(self, f'_first_call_done_{mode}', True)
         
         step = WanVideoAllParametersLoop._global_counters[mode]
-        
-        if mode == "sequential":
-            # Sequential loop through all combinations
-            index = step % total_combinations
-            
-        elif mode == "random":
-            # Random selection with seed
-            random.seed(seed + step)  # Different random for each step
-            index = random.randint(0, total_combinations - 1)
-            
-        elif mode == "ping_pong":
-            # Ping pong pattern: forward then backward
-            cycle_length = total_combinations * 2 - 2
-            if cycle_length <= 0:
-                cycle_length = 1
-            
-            pos = step % cycle_length
-            if pos < total_combinations:
-                index = pos
-            else:
-                index = total_combinations - 2 - (pos - total_combinations)
-            
-            index = max(0, min(index, total_combinations - 1))
-        
+        full_total = total_combinations
+        
+        # Early stop: collapse flat axes and traverse the re-planned, smaller grid
+        convergence = None
+        remaining = []
+        sweep_finished = False
+        if early_stop:
+            axes = dict(zip(self.AXIS_NAMES, (available_schedulers, cfg_values, shift_values, steps_values)))
+            convergence = self._update_convergence(mode, axes, score, reset, collapse_threshold,
+                                                   min_samples_per_value, higher_is_better)
+            pending = convergence["plan"] if convergence["plan"] is not None else convergence["grid"]
+            remaining = [combination for combination in pending if combination not in convergence["visited"]]
+            sweep_finished = not remaining
+            total_combinations = len(convergence["grid"])
+        elif WanVideoAllParametersLoop._convergence_states[mode] is not None:
+            # Runs without tracking must not have their score attributed once early stop is back on
+            WanVideoAllParametersLoop._convergence_states[mode]["last_combination"] = None
+        
+        # Current combination followed by the upcoming ones, as (index, combination) pairs
+        lookahead = max(prefetch_count, 1) + 1
+        if convergence is not None:
+            # Only combinations that have not run yet are picked; once none are left, hold the best one
+            picks = self._plan_picks(mode, step, seed, remaining, lookahead)
+            if len(picks) < lookahead:
+                picks += [self._best_combination(convergence, higher_is_better)] * (lookahead - len(picks))
+            sequence = [(convergence["grid"].index(combination), combination) for combination in picks]
         else:
-            # Fallback
-            index = 0
-        
-        # Calculate scheduler, cfg, shift, and steps indices from combined index
-        steps_index = index // (len(available_schedulers) * len(cfg_values) * len(shift_values))
-        remaining = index % (len(available_schedulers) * len(cfg_values) * len(shift_values))
-        
-        shift_index = remaining // (len(available_schedulers) * len(cfg_values))
-        remaining = remaining % (len(available_schedulers) * len(cfg_values))
-        
-        cfg_index = remaining // len(available_schedulers)
-        scheduler_index = remaining % len(available_schedulers)
-        
-        selected_scheduler = available_schedulers[scheduler_index]
-        selected_cfg = cfg_values[cfg_index]
-        selected_shift = shift_values[shift_index]
-        selected_steps = steps_values[steps_index]
+            sequence = []
+            for offset in range(lookahead):
+                selection = self._select(mode, step + offset, seed, total_combinations,
+                                         available_schedulers, cfg_values, shift_values, steps_values)
+                sequence.append((selection[0], selection[1:]))
+        
+        index, (selected_scheduler, selected_cfg, selected_shift, selected_steps) = sequence[0]
+        
+        if convergence is not None:
+            if sweep_finished:
+                # Nothing new ran, so there is no score to attribute next time
+                convergence["last_combination"] = None
+            else:
+                convergence["last_combination"] = sequence[0][1]
+                convergence["visited"].add(sequence[0][1])
+                remaining = [combination for combination in remaining if combination != sequence[0][1]]
+        collapse_report = self._collapse_report(convergence, full_total, remaining, sweep_finished)
 
         current_combination = f"Scheduler: {selected_scheduler}, {selected_steps} steps, CFG {selected_cfg:.2f}, Shift {selected_shift:.2f}"
         
+        # Look ahead without advancing the counter so downstream nodes can warm up
+        upcoming = []
+        for next_index, (next_scheduler, next_cfg, next_shift, next_steps) in sequence[1:]:
+            upcoming.append({"scheduler": next_scheduler, "steps": next_steps, "cfg": next_cfg, "shift": next_shift, "index": next_index,
+                             "combination": f"Scheduler: {next_scheduler}, {next_steps} steps, CFG {next_cfg:.2f}, Shift {next_shift:.2f}"})
+        if prefetch_count > 0:
+            prefetch_registry.publish(prefetch_registry.source_key("WanVideoAllParametersLoop", mode), upcoming)
+        upcoming_combinations = "\n".join(entry["combination"] for entry in upcoming[:prefetch_count])
+        
         # Log current selection for debugging
         print(f"WanVideo All Parameters Loop: Selected scheduler='{selected_scheduler}', cfg={selected_cfg}, shift={selected_shift}, steps={selected_steps} (index: {index}, step: {step}, mode: {mode}) [Global: {WanVideoAllParametersLoop._global_counters[mode]}]")
         print(f"  Available schedulers: {available_schedulers}")
@@ -623,8 +895,11 @@ class WanVideoAllParametersLoop:
         print(f"  Available shift values: {shift_values}")
         print(f"  Available steps values: {steps_values}")
         print(f"  Total combinations: {total_combinations}")
+        if convergence is not None:
+            print(f"  Early stop: {collapse_report}")
         
-        return (selected_cfg, selected_shift, selected_steps, selected_scheduler, index, total_combinations, current_combination)
+        return (selected_steps, selected_cfg, selected_shift, selected_scheduler, index, total_combinations, current_combination, collapse_report,
+                sweep_finished, upcoming[0]["steps"], upcoming[0]["cfg"], upcoming[0]["shift"], upcoming[0]["scheduler"], upcoming_combinations)
 
 
 # Node class mappings for ComfyUI
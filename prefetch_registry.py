@@ -0,0 +1,111 @@
+"""
+In-process registry of upcoming loop combinations.
+
+Loop nodes publish the next combination(s) they will emit without advancing
+their counters. Downstream custom nodes can read them with get_upcoming() or
+subscribe with register_listener() to warm per-scheduler state (sigma tables,
+compiled graphs, ...) while the current generation runs.
+
+Entries are keyed by "<node class>/<mode>" (see source_key), matching the
+per-mode counters the loop nodes keep, e.g. "WanVideoAllParametersLoop/random".
+Range loops only loop sequentially and publish under "<node class>/sequential".
+"""
+
+from __future__ import annotations
+import threading
+from typing import Callable, Dict, List, Optional
+
+Listener = Callable[[str, List[dict]], None]
+
+_lock = threading.Lock()
+_upcoming: Dict[str, List[dict]] = {}
+_workers: Dict[Listener, "_ListenerWorker"] = {}
+
+
+def source_key(node: str, mode: str = "sequential") -> str:
+    """Registry key for a loop node class and looping mode."""
+    return f"{node}/{mode}"
+
+
+class _ListenerWorker:
+    """
+    One background thread per listener. Only the latest entries per source are
+    kept, so predictions that went stale while a warm-up was running are dropped
+    instead of piling up.
+    """
+
+    def __init__(self, listener: Listener):
+        self.listener = listener
+        self._pending: Dict[str, List[dict]] = {}
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name=f"prefetch-{listener!r}", daemon=True)
+        self._thread.start()
+
+    def submit(self, source: str, entries: List[dict]) -> None:
+        with self._condition:
+            self._pending[source] = entries
+            self._condition.notify()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._pending.clear()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                source = next(iter(self._pending))
+                entries = self._pending.pop(source)
+
+            try:
+                self.listener(source, [dict(entry) for entry in entries])
+            except Exception as e:
+                print(f"Prefetch listener {self.listener!r} failed for {source}: {e}")
+
+
+def publish(source: str, upcoming: List[dict]) -> None:
+    """Store the upcoming combinations for a loop node and notify listeners.
+
+    Listeners run on their own worker thread so warm-up work never blocks the
+    loop node or the current generation.
+    """
+    entries = [dict(entry) for entry in upcoming]
+    with _lock:
+        _upcoming[source] = entries
+        workers = list(_workers.values())
+
+    for worker in workers:
+        worker.submit(source, entries)
+
+
+def get_upcoming(source: str) -> List[dict]:
+    """Return the last published upcoming combinations for a registry key."""
+    with _lock:
+        return [dict(entry) for entry in _upcoming.get(source, [])]
+
+
+def register_listener(listener: Listener) -> None:
+    with _lock:
+        if listener not in _workers:
+            _workers[listener] = _ListenerWorker(listener)
+
+
+def unregister_listener(listener: Listener) -> None:
+    with _lock:
+        worker = _workers.pop(listener, None)
+    if worker is not None:
+        worker.stop()
+
+
+def clear(source: Optional[str] = None) -> None:
+    with _lock:
+        if source is None:
+            _upcoming.clear()
+        else:
+            _upcoming.pop(source, None)
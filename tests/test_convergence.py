@@ -0,0 +1,65 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from convergence import AdditiveEffects
+
+# Default WanVideoAllParametersLoop grid with the fallback scheduler list (16 x 8 x 5 x 4)
+AXES = {
+    "scheduler": [f"scheduler_{i}" for i in range(16)],
+    "cfg": [float(cfg) for cfg in range(1, 9)],
+    "shift": [1.0, 1.5, 2.0, 2.5, 3.0],
+    "steps": [20, 30, 40, 50],
+}
+
+
+def _score(combination, noise):
+    _, cfg, _, steps = combination
+    return 0.02 * (steps - 20) + 0.1 * cfg + noise.gauss(0.0, 0.05)
+
+
+def _random_sweep(count, seed=0):
+    """Same picks as the node's random mode: seeded choice among combinations not run yet."""
+    remaining = [(scheduler, cfg, shift, steps) for steps in AXES["steps"] for shift in AXES["shift"]
+                 for cfg in AXES["cfg"] for scheduler in AXES["scheduler"]]
+    for step in range(count):
+        combination = random.Random(seed + step).choice(remaining)
+        remaining.remove(combination)
+        yield combination
+
+
+def _flat_axes(model, threshold=0.05, min_samples=2):
+    flat = {}
+    for name in AXES:
+        estimate = model.axis_effect(name, min_samples)
+        if estimate is not None and sum(estimate) < threshold:
+            flat[name] = estimate
+    return flat
+
+
+def test_no_test_without_residual_dof():
+    model = AdditiveEffects(AXES)
+    noise = random.Random(1)
+    for combination in _random_sweep(30):
+        model.add(combination, _score(combination, noise))
+        # 1 + 15 + 7 + 4 + 3 = 30 parameters: an exact fit must never look flat
+        assert _flat_axes(model) == {}
+
+
+def test_relevant_axes_are_never_collapsed():
+    model = AdditiveEffects(AXES)
+    noise = random.Random(1)
+    collapsed = {}
+    for combination in _random_sweep(400):
+        model.add(combination, _score(combination, noise))
+        for name in _flat_axes(model):
+            collapsed.setdefault(name, model.count)
+
+    assert "steps" not in collapsed
+    assert "cfg" not in collapsed
+    # Flat axes do collapse, long before the 2,560 combination grid has run
+    assert "shift" in collapsed
+    assert model.best_value("steps") == 50
+    assert model.best_value("steps", higher_is_better=False) == 20